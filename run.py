@@ -18,5 +18,7 @@ if __name__ == "__main__":
         info_file=config["info_file"],
         fps=config["fps"],
         sample_interval=config["sample_interval"],
+        chunk_size=config.get("chunk_size", 8),
+        use_gpu=config.get("use_gpu", False),
     )
     estimator.run()
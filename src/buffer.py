@@ -0,0 +1,45 @@
+from typing import Any, Tuple
+
+import numpy as np
+
+
+class GrowingArray:
+    """
+    Array that is appended one row at a time.
+
+    The rows are stored in a preallocated buffer that doubles its capacity
+    whenever it is full, so appends are amortized O(1) and the stored rows
+    can be read as an array view without copying.
+    """
+
+    def __init__(self, row_shape: Tuple[int, ...] = (), capacity: int = 256) -> None:
+        self._buffer: np.ndarray = np.empty((capacity, *row_shape), dtype=np.float64)
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, row: Any) -> None:
+        """
+        Append a row, growing the buffer if it is full.
+
+        Args:
+            row (Any): A value matching the row shape of the array.
+        """
+        if self._size == len(self._buffer):
+            grown = np.empty(
+                (2 * self._size, *self._buffer.shape[1:]), dtype=self._buffer.dtype
+            )
+            grown[: self._size] = self._buffer
+            self._buffer = grown
+        self._buffer[self._size] = row
+        self._size += 1
+
+    def view(self) -> np.ndarray:
+        """
+        Get the appended rows without copying.
+
+        Returns:
+            np.ndarray: A view of the first len(self) rows of the buffer.
+        """
+        return self._buffer[: self._size]
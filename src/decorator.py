@@ -1,65 +1,72 @@
+import math
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Tuple
 
-import matplotlib.pyplot as plt
+import cv2
 import numpy as np
 
+CHI2_95 = math.sqrt(5.991)
+
 
 class PlotDecorator(ABC):
     """
-    Abstract decorator for matplotlib Figures.
+    Abstract decorator for annotated video frames.
 
     This decorator defines a common interface to extend plot functionalities.
     """
 
-    def __init__(self, plot_func: Callable[..., plt.Figure]) -> None:
+    def __init__(self, plot_func: Callable[..., np.ndarray]) -> None:
         self._plot_func = plot_func
 
     @abstractmethod
-    def render(self, *args: Any, **kwargs: Any) -> plt.Figure:
+    def render(self, *args: Any, **kwargs: Any) -> np.ndarray:
         """
         Extend the plotting function to add additional visual elements.
 
         Returns:
-            plt.Figure: The enhanced matplotlib figure.
+            np.ndarray: The enhanced image.
         """
         pass
 
 
 class InertiaPlotDecorator(PlotDecorator):
     """
-    Decorator that adds an ellipse to represent inertia on the plot.
+    Decorator that adds an ellipse to represent inertia on the image.
     """
 
     def render(
         self,
         centroid: Tuple[float, float],
-        eigenvalues: np.ndarray,
+        eigenvalues: Tuple[float, float],
         angle: float,
-        base_fig: plt.Figure,
-    ) -> plt.Figure:
+        base_image: np.ndarray,
+    ) -> np.ndarray:
         """
-        Render the base figure and add an inertia ellipse.
+        Render the base image and add an inertia ellipse.
 
         Args:
             centroid (Tuple[float, float]): The (x, y) centroid coordinates.
-            eigenvalues (np.ndarray): The eigenvalues of the inertia matrix.
+            eigenvalues (Tuple[float, float]): The major and minor eigenvalues of
+                the inertia matrix.
             angle (float): The angle of orientation in degrees.
-            base_fig (plt.Figure): The original figure.
+            base_image (np.ndarray): The original BGR image, drawn in place.
 
         Returns:
-            plt.Figure: The figure with the inertia ellipse added.
+            np.ndarray: The image with the inertia ellipse added.
         """
-        ax = base_fig.axes[0]
-        ellipse = plt.matplotlib.patches.Ellipse(
-            centroid,
-            width=np.sqrt(eigenvalues[0] * 5.991),
-            height=np.sqrt(eigenvalues[1] * 5.991),
-            angle=angle,
-            edgecolor="c",
-            linewidth=2,
-            fill=False,
-            label="Inertia",
+        axes = tuple(
+            round(CHI2_95 * math.sqrt(max(eigenvalue, 0.0)) / 2)
+            for eigenvalue in eigenvalues
+        )
+        cv2.ellipse(
+            base_image,
+            (round(centroid[0]), round(centroid[1])),
+            axes,
+            angle,
+            0,
+            360,
+            (255, 255, 0),
+            2,
+            cv2.LINE_AA,
         )
-        ax.add_patch(ellipse)
-        return base_fig
+        return base_image
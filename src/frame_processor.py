@@ -1,14 +1,18 @@
+import math
 from typing import Any, List, Optional, Tuple
 
 import cv2
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 
+from src.buffer import GrowingArray
 from src.decorator import InertiaPlotDecorator
 from src.observer import CentroidObserver, CentroidTracker
 from src.strategy import ThresholdStrategy
 
+BLUE = (255, 0, 0)
+GREEN = (0, 128, 0)
+RED = (0, 0, 255)
+
 
 class FrameProcessorFacade:
     """
@@ -20,10 +24,22 @@ class FrameProcessorFacade:
 
     def __init__(self, threshold_strategy: ThresholdStrategy) -> None:
         self._strategy: ThresholdStrategy = threshold_strategy
-        self._kernel: np.ndarray = np.ones((3, 3), dtype=np.uint8)
         self._observers: List[CentroidObserver] = []
         self.velocities: List[float] = []
-        self.angles: List[float] = []
+        self._angles: GrowingArray = GrowingArray()
+        self._decorator: InertiaPlotDecorator = InertiaPlotDecorator(
+            lambda image: image
+        )
+
+    @property
+    def angles(self) -> np.ndarray:
+        """
+        Get the smoothed orientation angles of the processed frames.
+
+        Returns:
+            np.ndarray: A view of the angles in degrees, one per frame.
+        """
+        return self._angles.view()
 
     def attach_observer(self, observer: CentroidObserver) -> None:
         """
@@ -44,85 +60,117 @@ class FrameProcessorFacade:
         for observer in self._observers:
             observer.update(centroid)
 
-    def process(self, frame: np.ndarray) -> Tuple[plt.Figure, Optional[float]]:
+    def process(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[float]]:
         """
-        Process the frame to extract motion parameters and generate a plot.
+        Process the frame to extract motion parameters and annotate it.
+
+        The frame is annotated in place.
 
         Args:
             frame (np.ndarray): The input video frame.
 
         Returns:
-            Tuple[plt.Figure, Optional[float]]: A tuple containing the matplotlib figure
-            with the processed frame and the instantaneous speed if available.
+            Tuple[np.ndarray, Optional[float]]: A tuple containing the BGR frame
+            annotated with the centroid, inertia ellipse and trajectory, and the
+            instantaneous speed if available.
         """
-        fig, ax = plt.subplots()
-        ax.imshow(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-        thresholded: np.ndarray = self._strategy.apply(frame)
-        morphed: np.ndarray = cv2.erode(
-            cv2.dilate(thresholded, self._kernel), self._kernel
-        )
-        _, labels = cv2.connectedComponents(morphed)
-        blobs: np.ndarray = labels > 0
-        m00: float = np.sum(blobs)
-        rows, cols = blobs.shape
-        X, Y = np.meshgrid(np.arange(cols), np.arange(rows))
-        uc: float = np.sum(X * blobs) / m00
-        vc: float = np.sum(Y * blobs) / m00
+        return self._annotate(frame, self._strategy.moments(frame))
+
+    def process_batch(
+        self, frames: np.ndarray
+    ) -> List[Tuple[np.ndarray, Optional[float]]]:
+        """
+        Process a batch of frames, computing all their moments in one call.
+
+        The frames are annotated in place.
+
+        Args:
+            frames (np.ndarray): The input video frames as a (c, H, W, 3) array.
+
+        Returns:
+            List[Tuple[np.ndarray, Optional[float]]]: The annotated BGR frame and
+            the instantaneous speed of each frame, in order.
+        """
+        moments: np.ndarray = self._strategy.moments_batch(frames)
+        return [self._annotate(frame, m) for frame, m in zip(frames, moments)]
+
+    def _annotate(
+        self, frame: np.ndarray, moments: np.ndarray
+    ) -> Tuple[np.ndarray, Optional[float]]:
+        """
+        Extract motion parameters from the frame moments and annotate the frame.
+
+        Args:
+            frame (np.ndarray): The input BGR video frame, annotated in place.
+            moments (np.ndarray): The raw moments (m00, m10, m01, m20, m02, m11)
+                of the thresholded frame.
+
+        Returns:
+            Tuple[np.ndarray, Optional[float]]: The annotated BGR frame and the
+            instantaneous speed if available.
+        """
+        image: np.ndarray = frame
+        m00, m10, m01, m20, m02, m11 = moments
+        if m00 == 0:
+            return image, None
+        uc: float = m10 / m00
+        vc: float = m01 / m00
         self._notify((uc, vc))
-        ax.scatter(
-            uc, vc, facecolors="none", edgecolors="b", marker="o", label="Centroid"
-        )
+        cv2.circle(image, (round(uc), round(vc)), 5, BLUE, 2, cv2.LINE_AA)
 
-        u20: float = np.sum(((X - uc) ** 2) * blobs) / m00
-        u02: float = np.sum(((Y - vc) ** 2) * blobs) / m00
-        u11: float = np.sum((X - uc) * (Y - vc) * blobs) / m00
-        inertia_matrix: np.ndarray = np.array([[u20, u11], [u11, u02]])
-        eigenvalues, eigenvectors = np.linalg.eig(inertia_matrix)
-        idx_max: int = np.argmax(eigenvalues)
-        angle_rad: float = np.arctan2(
-            eigenvectors[1, idx_max], eigenvectors[0, idx_max]
-        )
-        angle_deg: float = np.rad2deg(angle_rad)
-        self.angles.append(angle_deg)
+        u20: float = m20 / m00 - uc**2
+        u02: float = m02 / m00 - vc**2
+        u11: float = m11 / m00 - uc * vc
+        half_trace: float = (u20 + u02) / 2
+        spread: float = math.hypot((u20 - u02) / 2, u11)
+        eigenvalues: Tuple[float, float] = (half_trace + spread, half_trace - spread)
+        angle_rad: float = 0.5 * math.atan2(2 * u11, u20 - u02)
+        angle_deg: float = math.degrees(angle_rad)
 
         threshold = 120
-        if len(self.angles) > 1:
-            if abs(self.angles[-1] - self.angles[-2]) > threshold:
-                self.angles[-1] = (
-                    self.angles[-2]
-                    + (self.angles[-3] if len(self.angles) > 2 else self.angles[-2])
-                ) / 2
+        smoothed: float = angle_deg
+        angles: np.ndarray = self._angles.view()
+        if len(angles) > 0:
+            previous: float = angles[-1]
+            if math.fabs(angle_deg - previous) > threshold:
+                before: float = angles[-2] if len(angles) > 1 else previous
+                smoothed = (previous + before) / 2
+        self._angles.append(smoothed)
 
-        decorator = InertiaPlotDecorator(lambda *args, **kwargs: fig)
-        fig = decorator.render((uc, vc), eigenvalues, angle_deg, fig)
+        image = self._decorator.render((uc, vc), eigenvalues, angle_deg, image)
 
         instantaneous_speed: Optional[float] = None
         if self._observers and isinstance(self._observers[0], CentroidTracker):
-            history: List[Tuple[float, float]] = self._observers[0].get_history()
+            history: np.ndarray = self._observers[0].get_array()
             if len(history) > 1:
-                history_np = np.array(history)
-                ax.plot(history_np[:, 0], history_np[:, 1], "ro-", label="Trajectory")
-                dx: float = history_np[-1, 0] - history_np[-2, 0]
-                dy: float = history_np[-1, 1] - history_np[-2, 1]
-                arrow_scale: float = 25
-                ax.arrow(
-                    history_np[-1, 0],
-                    history_np[-1, 1],
-                    dx,
-                    dy,
-                    head_width=arrow_scale,
-                    head_length=arrow_scale * 1.5,
-                    fc="g",
-                    ec="g",
-                )
+                points = np.rint(history).astype(np.int32)
+                cv2.polylines(image, [points], False, RED, 1, cv2.LINE_AA)
+                for px, py in points:
+                    cv2.circle(image, (int(px), int(py)), 3, RED, -1, cv2.LINE_AA)
+                x, y = history[-1]
+                dx: float = x - history[-2, 0]
+                dy: float = y - history[-2, 1]
                 instantaneous_speed = np.sqrt(dx**2 + dy**2)
                 self.velocities.append(instantaneous_speed)
-                ax.text(
-                    history_np[-1, 0] + 10,
-                    history_np[-1, 1] + 10,
+                arrow_scale: float = 25
+                tip_length: float = arrow_scale * 1.5 / max(instantaneous_speed, 1.0)
+                cv2.arrowedLine(
+                    image,
+                    (round(x), round(y)),
+                    (round(x + dx), round(y + dy)),
+                    GREEN,
+                    2,
+                    cv2.LINE_AA,
+                    tipLength=min(tip_length, 1.0),
+                )
+                cv2.putText(
+                    image,
                     f"{instantaneous_speed:.2f} px/frame",
-                    color="g",
+                    (round(x + 10), round(y + 10)),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.5,
+                    GREEN,
+                    1,
+                    cv2.LINE_AA,
                 )
-        ax.legend()
-        plt.close(fig)
-        return fig, instantaneous_speed
+        return image, instantaneous_speed
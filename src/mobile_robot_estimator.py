@@ -1,16 +1,19 @@
-import sys
-from typing import List, Optional, Tuple
+import queue
+import threading
+from typing import List, Optional
 
-import matplotlib.pyplot as plt
+import cv2
 import numpy as np
-from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+from matplotlib.figure import Figure
 
 from src.command import LogCommand
 from src.factory import VideoCaptureFactory
 from src.frame_processor import FrameProcessorFacade
 from src.observer import CentroidTracker
 from src.singleton import VideoWriterSingleton
-from src.strategy import RedColorThresholdStrategy
+from src.strategy import RedColorThresholdStrategy, ThresholdStrategy
+
+_QUEUE_SIZE = 8
 
 
 class MobileRobotEstimatorFacade:
@@ -28,33 +31,103 @@ class MobileRobotEstimatorFacade:
         info_file: str,
         fps: int,
         sample_interval: int,
+        chunk_size: int = 8,
+        use_gpu: bool = False,
     ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
         self._fps: int = fps
         self._sample_interval: int = sample_interval
+        self._chunk_size: int = chunk_size
         self._video_capture = VideoCaptureFactory.create(video_file)
+        if not self._video_capture.isOpened():
+            raise RuntimeError(f"Could not open video file {video_file}")
         self._video_writer = VideoWriterSingleton(output_video, fps)
-        self._processor: FrameProcessorFacade = FrameProcessorFacade(
-            RedColorThresholdStrategy()
+        self._video_writer.open(
+            int(self._video_capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(self._video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
         )
+        strategy: ThresholdStrategy = RedColorThresholdStrategy()
+        if use_gpu:
+            from src.strategy_gpu import CupyRedColorThresholdStrategy
+
+            strategy = CupyRedColorThresholdStrategy()
+        self._processor: FrameProcessorFacade = FrameProcessorFacade(strategy)
         self._tracker: CentroidTracker = CentroidTracker()
         self._processor.attach_observer(self._tracker)
         self._total_distance: float = 0.0
         self._frame_count: int = 0
         self._info_file: str = info_file
-        self._original_stdout = sys.stdout
         self._log_command = LogCommand(self._log_parameters)
+        self._worker_errors: List[Exception] = []
 
-    def _redirect_stdout(self) -> None:
+    def _read_frames(
+        self, frames: "queue.Queue[Optional[np.ndarray]]", stop: threading.Event
+    ) -> None:
         """
-        Redirect the standard output to the info file.
+        Queue the sampled video frames, ending with a None sentinel.
+
+        Every frame is grabbed to advance the video and count it, but only the
+        frames at the sampling interval are retrieved into BGR images. Any
+        error is recorded for run() to raise, and the sentinel is always sent.
+
+        Args:
+            frames (queue.Queue): The queue receiving the sampled frames.
+            stop (threading.Event): Set by run() to stop reading early.
         """
-        sys.stdout = open(self._info_file, "w")
+        try:
+            while not stop.is_set() and self._video_capture.grab():
+                if self._frame_count % self._sample_interval == 0:
+                    ret, frame = self._video_capture.retrieve()
+                    if not ret:
+                        break
+                    frames.put(frame)
+                self._frame_count += 1
+        except Exception as error:
+            self._worker_errors.append(error)
+        finally:
+            self._video_capture.release()
+            frames.put(None)
 
-    def _restore_stdout(self) -> None:
+    def _write_frames(self, images: "queue.Queue[Optional[np.ndarray]]") -> None:
         """
-        Restore the standard output to its original stream.
+        Encode the annotated images from a queue until a None sentinel arrives.
+
+        After a write error, the error is recorded for run() to raise and the
+        queue keeps being drained, so the main thread never blocks on it.
+
+        Args:
+            images (queue.Queue): The queue providing the annotated images.
         """
-        sys.stdout = self._original_stdout
+        failed = False
+        while True:
+            image = images.get()
+            if image is None:
+                break
+            if failed:
+                continue
+            try:
+                self._video_writer.append_frame(image)
+            except Exception as error:
+                self._worker_errors.append(error)
+                failed = True
+
+    def _process_chunk(
+        self,
+        chunk: List[np.ndarray],
+        images: "queue.Queue[Optional[np.ndarray]]",
+    ) -> None:
+        """
+        Process a chunk of sampled frames and queue the annotated images.
+
+        Args:
+            chunk (List[np.ndarray]): The sampled frames, in order.
+            images (queue.Queue): The queue receiving the annotated images.
+        """
+        for image, speed in self._processor.process_batch(np.stack(chunk)):
+            if speed is not None:
+                self._total_distance += speed
+            images.put(image)
 
     def _log_parameters(self) -> None:
         """
@@ -65,19 +138,21 @@ class MobileRobotEstimatorFacade:
         average_speed: float = (
             self._total_distance / total_time if total_time > 0 else 0
         )
-        print("\nRobot Parameters:")
-        print(f"Video FPS: {self._fps} frames per second")
-        print(f"Sampling Interval: every {self._sample_interval} frames")
-        print(f"Average Speed: {average_speed:.2f} pixels per second")
-        print(f"Total Distance: {self._total_distance:.2f} pixels")
-        print(f"Total Time: {total_time:.2f} seconds")
+        with open(self._info_file, "w") as file:
+            file.write("\nRobot Parameters:\n")
+            file.write(f"Video FPS: {self._fps} frames per second\n")
+            file.write(f"Sampling Interval: every {self._sample_interval} frames\n")
+            file.write(f"Average Speed: {average_speed:.2f} pixels per second\n")
+            file.write(f"Total Distance: {self._total_distance:.2f} pixels\n")
+            file.write(f"Total Time: {total_time:.2f} seconds\n")
 
     def _plot_trajectory(self) -> None:
         """
         Plot and save the complete trajectory of the robot.
         """
-        fig, ax = plt.subplots()
-        history: np.ndarray = np.array(self._tracker.get_history())
+        fig = Figure()
+        ax = fig.subplots()
+        history: np.ndarray = self._tracker.get_array()
         ax.set_xlim(0, 900)
         ax.set_ylim(0, 550)
         ax.invert_yaxis()
@@ -93,26 +168,25 @@ class MobileRobotEstimatorFacade:
         ax.set_xlabel("Horizontal Position")
         ax.set_ylabel("Vertical Position")
         ax.legend()
-        plt.title("Complete Trajectory")
-        plt.savefig("outputs/Robot_trajectory.png")
-        plt.show()
-        plt.close(fig)
+        ax.set_title("Complete Trajectory")
+        fig.savefig("outputs/Robot_trajectory.png")
 
     def _plot_angles(self) -> None:
         """
         Plot and save the robot orientation angle across frames.
+
+        The angles are unwrapped with a period of 180 degrees, as the principal
+        axis has no preferred direction.
         """
-        fig, ax = plt.subplots()
-        ax.plot(
-            range(len(self._processor.angles)), self._processor.angles, label="Angle"
-        )
+        fig = Figure()
+        ax = fig.subplots()
+        angles: np.ndarray = np.unwrap(self._processor.angles, period=180)
+        ax.plot(range(len(angles)), angles, label="Angle")
         ax.set_xlabel("Frame Number")
         ax.set_ylabel("Angle (degrees)")
         ax.legend()
-        plt.title("Angle in Each Frame")
-        plt.savefig("outputs/Robot_angles.png")
-        plt.show()
-        plt.close(fig)
+        ax.set_title("Angle in Each Frame")
+        fig.savefig("outputs/Robot_angles.png")
 
     def _plot_positions(self) -> None:
         """
@@ -122,10 +196,11 @@ class MobileRobotEstimatorFacade:
         - The x-coordinate (horizontal position) versus the frame number.
         - The y-coordinate (vertical position) versus the frame number.
         """
-        history: np.ndarray = np.array(self._tracker.get_history())
+        history: np.ndarray = self._tracker.get_array()
         if history.size == 0:
             return
-        fig, (ax1, ax2) = plt.subplots(2, 1, sharex=True, figsize=(8, 6))
+        fig = Figure(figsize=(8, 6))
+        ax1, ax2 = fig.subplots(2, 1, sharex=True)
         ax1.plot(history[:, 0], "b-o", label="X Position")
         ax1.set_ylabel("X Position (pixels)")
         ax1.legend()
@@ -133,41 +208,52 @@ class MobileRobotEstimatorFacade:
         ax2.set_xlabel("Frame Number")
         ax2.set_ylabel("Y Position (pixels)")
         ax2.legend()
-        plt.title("Robot X and Y Positions over Frames")
-        plt.savefig("outputs/Robot_positions.png")
-        plt.show()
-        plt.close(fig)
+        ax2.set_title("Robot X and Y Positions over Frames")
+        fig.savefig("outputs/Robot_positions.png")
 
     def run(self) -> None:
         """
         Execute the full estimation process over the video.
 
         This method processes the video frames, writes the annotated frames
-        to an output video, logs parameters, and generates plots.
+        to an output video, logs parameters, and generates plots. Decoding and
+        encoding run in background threads so they overlap with processing,
+        and sampled frames are processed in chunks of chunk_size frames. An
+        error in either thread stops the run and is raised here once both
+        threads have finished.
         """
-        self._redirect_stdout()
-        instantaneous_speed: Optional[float] = None
-        while True:
-            ret, frame = self._video_capture.read()
-            if not ret:
-                self._video_capture.release()
-                break
-            if self._frame_count % self._sample_interval == 0:
-                fig, speed = self._processor.process(frame)
-                if speed is not None:
-                    history: List[Tuple[float, float]] = self._tracker.get_history()
-                    if len(history) > 1:
-                        dx: float = history[-1][0] - history[-2][0]
-                        dy: float = history[-1][1] - history[-2][1]
-                        self._total_distance += (dx**2 + dy**2) ** 0.5
-                canvas: FigureCanvas = FigureCanvas(fig)
-                canvas.draw()
-                image = np.array(canvas.renderer.buffer_rgba())
-                self._video_writer.append_frame(image)
-            self._frame_count += 1
+        frames: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(_QUEUE_SIZE)
+        images: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(_QUEUE_SIZE)
+        stop = threading.Event()
+        reader = threading.Thread(target=self._read_frames, args=(frames, stop))
+        writer = threading.Thread(target=self._write_frames, args=(images,))
+        reader.start()
+        writer.start()
+        finished = False
+        try:
+            chunk: List[np.ndarray] = []
+            while not self._worker_errors:
+                frame = frames.get()
+                if frame is None:
+                    finished = True
+                    break
+                chunk.append(frame)
+                if len(chunk) == self._chunk_size:
+                    self._process_chunk(chunk, images)
+                    chunk = []
+            if chunk and not self._worker_errors:
+                self._process_chunk(chunk, images)
+        finally:
+            stop.set()
+            while not finished:
+                finished = frames.get() is None
+            images.put(None)
+            reader.join()
+            writer.join()
+        if self._worker_errors:
+            raise self._worker_errors[0]
         self._log_command.execute()
         self._video_writer.close()
-        self._restore_stdout()
         self._plot_trajectory()
         self._plot_angles()
         self._plot_positions()
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import List, Tuple
 
+import numpy as np
+
+from src.buffer import GrowingArray
+
 
 class CentroidObserver(ABC):
     """
@@ -26,7 +30,7 @@ class CentroidTracker(CentroidObserver):
     """
 
     def __init__(self) -> None:
-        self._history: List[Tuple[float, float]] = []
+        self._history: GrowingArray = GrowingArray((2,))
 
     def update(self, centroid: Tuple[float, float]) -> None:
         """
@@ -37,6 +41,15 @@ class CentroidTracker(CentroidObserver):
         """
         self._history.append(centroid)
 
+    def get_array(self) -> np.ndarray:
+        """
+        Get the tracked centroids as an array without copying.
+
+        Returns:
+            np.ndarray: An (N, 2) view of the history of centroid coordinates.
+        """
+        return self._history.view()
+
     def get_history(self) -> List[Tuple[float, float]]:
         """
         Get the list of tracked centroids.
@@ -44,4 +57,4 @@ class CentroidTracker(CentroidObserver):
         Returns:
             List[Tuple[float, float]]: The history of centroid coordinates.
         """
-        return self._history
+        return [(x, y) for x, y in self.get_array().tolist()]
@@ -1,6 +1,7 @@
+import warnings
 from typing import Optional
 
-import imageio
+import cv2
 import numpy as np
 
 
@@ -22,19 +23,65 @@ class VideoWriterSingleton:
     def _initialize(self, filename: str, fps: int) -> None:
         """
         Initialize the video writer.
+
+        The underlying cv2.VideoWriter is created by open(), once the frame
+        size is known.
+        """
+        self._filename: str = filename
+        self._fps: int = fps
+        self._frame_count: int = 0
+        self.writer: Optional[cv2.VideoWriter] = None
+
+    def open(self, width: int, height: int) -> None:
+        """
+        Open an H.264 writer, falling back to MPEG-4 if H.264 is unavailable.
+
+        OpenCV logging is silenced while the codecs are probed, so a missing
+        H.264 encoder does not print errors before the fallback is used.
+
+        Args:
+            width (int): The frame width in pixels.
+            height (int): The frame height in pixels.
+
+        Raises:
+            RuntimeError: If no codec can open the output file.
         """
-        self.writer = imageio.get_writer(
-            filename, fps=fps, codec="libx264", format="ffmpeg"
+        if self.writer is not None:
+            return
+        level = cv2.getLogLevel()
+        cv2.setLogLevel(0)
+        try:
+            for codec in ("avc1", "mp4v"):
+                writer = cv2.VideoWriter(
+                    self._filename,
+                    cv2.VideoWriter_fourcc(*codec),
+                    self._fps,
+                    (width, height),
+                )
+                if writer.isOpened():
+                    self.writer = writer
+                    return
+        finally:
+            cv2.setLogLevel(level)
+        raise RuntimeError(
+            f"Could not open video writer for {self._filename}; "
+            "check that its directory exists"
         )
 
     def append_frame(self, frame: np.ndarray) -> None:
         """
-        Append a frame to the video.
+        Append a BGR frame to the video.
         """
-        self.writer.append_data(frame)
+        if self.writer is None:
+            raise RuntimeError("The video writer must be opened before writing")
+        self.writer.write(frame)
+        self._frame_count += 1
 
     def close(self) -> None:
         """
-        Finalize and close the video writer.
+        Finalize and close the video writer, warning if no frame was written.
         """
-        self.writer.close()
+        if self.writer is not None:
+            self.writer.release()
+        if self._frame_count == 0:
+            warnings.warn(f"No frames were written to {self._filename}")
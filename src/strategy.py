@@ -1,7 +1,98 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 
 import cv2
 import numpy as np
+from numba import njit, prange, types
+
+_CLOSING_KERNEL = np.ones((3, 3), dtype=np.uint8)
+
+_THRESHOLD_SIGNATURE = types.void(
+    types.Array(types.uint8, 4, "C", readonly=True),
+    types.Array(types.uint8, 3, "C"),
+)
+
+_MOMENTS_SIGNATURE = types.Array(types.float64, 2, "C")(
+    types.Array(types.uint8, 3, "C", readonly=True),
+)
+
+
+def _red_threshold(frames: np.ndarray, binary: np.ndarray) -> None:
+    """
+    Write the red chromaticity threshold of a batch of frames into a buffer.
+
+    The limits r >= 0.5 and g <= 0.2 are evaluated as the integer comparisons
+    2R >= Y and 5G <= Y, so no division is needed. This function is compiled
+    by RedColorThresholdStrategy on first use.
+
+    Args:
+        frames (np.ndarray): The input BGR frames as a (c, H, W, 3) uint8 array.
+        binary (np.ndarray): The (c, H, W) uint8 output buffer.
+    """
+    count, rows, cols = frames.shape[0], frames.shape[1], frames.shape[2]
+    for index in prange(count * rows):
+        k = index // rows
+        i = index % rows
+        for j in range(cols):
+            b = np.int32(frames[k, i, j, 0])
+            g = np.int32(frames[k, i, j, 1])
+            r = np.int32(frames[k, i, j, 2])
+            y = r + g + b
+            if y > 0 and 2 * r >= y and 5 * g <= y:
+                binary[k, i, j] = 255
+            else:
+                binary[k, i, j] = 0
+
+
+def _mask_moments(masks: np.ndarray) -> np.ndarray:
+    """
+    Accumulate the raw moments of the nonzero pixels of a batch of masks.
+
+    Each row of each mask is reduced independently, so all the rows of the
+    batch are distributed across threads before being summed per mask. This
+    function is compiled by RedColorThresholdStrategy on first use, releasing
+    the GIL so the video reader and writer threads keep working meanwhile.
+
+    Args:
+        masks (np.ndarray): The binary masks as a (c, H, W) uint8 array.
+
+    Returns:
+        np.ndarray: A (c, 6) array of raw moments (m00, m10, m01, m20, m02, m11).
+    """
+    count, rows, cols = masks.shape[0], masks.shape[1], masks.shape[2]
+    partial = np.zeros((count, rows, 6))
+    for index in prange(count * rows):
+        k = index // rows
+        i = index % rows
+        s = 0
+        sx = 0
+        sxx = 0
+        for j in range(cols):
+            if masks[k, i, j] != 0:
+                s += 1
+                sx += j
+                sxx += j * j
+        partial[k, i, 0] = s
+        partial[k, i, 1] = sx
+        partial[k, i, 2] = s * i
+        partial[k, i, 3] = sxx
+        partial[k, i, 4] = s * i * i
+        partial[k, i, 5] = sx * i
+    return partial.sum(axis=1)
+
+
+def _close(binary: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fill small gaps in a binary image with a 3x3 morphological closing.
+
+    Args:
+        binary (np.ndarray): The binary image.
+        dst (Optional[np.ndarray]): An output buffer of the same shape, if any.
+
+    Returns:
+        np.ndarray: The closed binary image.
+    """
+    return cv2.morphologyEx(binary, cv2.MORPH_CLOSE, _CLOSING_KERNEL, dst=dst)
 
 
 class ThresholdStrategy(ABC):
@@ -24,6 +115,43 @@ class ThresholdStrategy(ABC):
         """
         pass
 
+    def moments(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Compute the raw spatial moments of the thresholded and closed frame.
+
+        Args:
+            frame (np.ndarray): The input color image frame.
+
+        Returns:
+            np.ndarray: The raw moments (m00, m10, m01, m20, m02, m11).
+        """
+        m = cv2.moments(_close(self.apply(frame)), binaryImage=True)
+        return np.array([m["m00"], m["m10"], m["m01"], m["m20"], m["m02"], m["m11"]])
+
+    def apply_batch(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Apply the thresholding algorithm to a batch of frames.
+
+        Args:
+            frames (np.ndarray): The input color frames as a (c, H, W, 3) array.
+
+        Returns:
+            np.ndarray: The thresholded binary images as a (c, H, W) array.
+        """
+        return np.stack([self.apply(frame) for frame in frames])
+
+    def moments_batch(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Compute the raw spatial moments of a batch of thresholded and closed frames.
+
+        Args:
+            frames (np.ndarray): The input color frames as a (c, H, W, 3) array.
+
+        Returns:
+            np.ndarray: A (c, 6) array of raw moments (m00, m10, m01, m20, m02, m11).
+        """
+        return np.stack([self.moments(frame) for frame in frames])
+
 
 class RedColorThresholdStrategy(ThresholdStrategy):
     """
@@ -33,6 +161,35 @@ class RedColorThresholdStrategy(ThresholdStrategy):
     based on pre-defined limits.
     """
 
+    def __init__(self) -> None:
+        self._threshold_kernel: Optional[Callable[..., None]] = None
+        self._moments_kernel: Optional[Callable[[np.ndarray], np.ndarray]] = None
+        self._binary: Optional[np.ndarray] = None
+        self._closed: Optional[np.ndarray] = None
+
+    def _threshold(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Threshold a batch of frames with the compiled kernel.
+
+        The kernel is compiled for the exact argument types on first use, and
+        the returned images are a buffer reused by the next call, so the
+        public methods hand out copies.
+
+        Args:
+            frames (np.ndarray): The input color frames as a (c, H, W, 3) array.
+
+        Returns:
+            np.ndarray: The binary images as a (c, H, W) array.
+        """
+        if self._threshold_kernel is None:
+            self._threshold_kernel = njit(
+                _THRESHOLD_SIGNATURE, parallel=True, cache=True, nogil=True
+            )(_red_threshold)
+        if self._binary is None or self._binary.shape != frames.shape[:-1]:
+            self._binary = np.empty(frames.shape[:-1], dtype=np.uint8)
+        self._threshold_kernel(np.ascontiguousarray(frames), self._binary)
+        return self._binary
+
     def apply(self, frame: np.ndarray) -> np.ndarray:
         """
         Convert the input frame to a binary image highlighting red regions.
@@ -43,11 +200,53 @@ class RedColorThresholdStrategy(ThresholdStrategy):
         Returns:
             np.ndarray: The binary image after thresholding.
         """
-        R = frame[:, :, 2].astype(np.float32)
-        G = frame[:, :, 1].astype(np.float32)
-        B = frame[:, :, 0].astype(np.float32)
-        Y = R + G + B
-        r = np.divide(R, Y, out=np.zeros_like(R), where=Y != 0)
-        g = np.divide(G, Y, out=np.zeros_like(G), where=Y != 0)
-        binary = ((r >= 0.5) & (g <= 0.2)).astype(np.uint8) * 255
-        return binary
+        return self._threshold(frame[np.newaxis])[0].copy()
+
+    def apply_batch(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Convert a batch of frames to binary images highlighting red regions.
+
+        Args:
+            frames (np.ndarray): The input color frames as a (c, H, W, 3) array.
+
+        Returns:
+            np.ndarray: The binary images as a (c, H, W) array.
+        """
+        return self._threshold(frames).copy()
+
+    def moments(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Compute the raw spatial moments of the red regions of the frame.
+
+        Args:
+            frame (np.ndarray): The input color image frame.
+
+        Returns:
+            np.ndarray: The raw moments (m00, m10, m01, m20, m02, m11).
+        """
+        return self.moments_batch(frame[np.newaxis])[0]
+
+    def moments_batch(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Compute the raw spatial moments of the red regions of a batch of frames.
+
+        The whole batch is thresholded at once, each mask is closed to fill
+        small gaps, and the moments of all masks are summed by one kernel,
+        compiled for the exact argument types on first use.
+
+        Args:
+            frames (np.ndarray): The input color frames as a (c, H, W, 3) array.
+
+        Returns:
+            np.ndarray: A (c, 6) array of raw moments (m00, m10, m01, m20, m02, m11).
+        """
+        masks = self._threshold(frames)
+        if self._closed is None or self._closed.shape != masks.shape:
+            self._closed = np.empty_like(masks)
+        for mask, closed in zip(masks, self._closed):
+            _close(mask, dst=closed)
+        if self._moments_kernel is None:
+            self._moments_kernel = njit(
+                _MOMENTS_SIGNATURE, parallel=True, fastmath=True, cache=True, nogil=True
+            )(_mask_moments)
+        return self._moments_kernel(self._closed)
@@ -0,0 +1,168 @@
+from typing import Optional, Tuple
+
+import cupy as cp
+import cupyx
+import numpy as np
+from cupyx.scipy import ndimage
+
+from src.strategy import ThresholdStrategy
+
+_BLOCK_SIZE = 256
+_MAX_BLOCKS = 1024
+
+_RED_THRESHOLD = cp.ElementwiseKernel(
+    "uint8 b, uint8 g, uint8 r",
+    "uint8 binary",
+    "int y = b + g + r; binary = (y > 0 && 2 * r >= y && 5 * g <= y) ? 255 : 0",
+    "red_threshold",
+)
+
+_MASK_MOMENTS = cp.RawKernel(
+    r"""
+extern "C" __global__
+void mask_moments(const unsigned char* mask, int rows, int cols, double* moments)
+{
+    __shared__ double partial[6][256];
+    double sums[6] = {0.0, 0.0, 0.0, 0.0, 0.0, 0.0};
+    int size = rows * cols;
+    for (int p = blockIdx.x * blockDim.x + threadIdx.x; p < size;
+         p += blockDim.x * gridDim.x) {
+        if (mask[p] != 0) {
+            double i = p / cols;
+            double j = p % cols;
+            sums[0] += 1.0;
+            sums[1] += j;
+            sums[2] += i;
+            sums[3] += j * j;
+            sums[4] += i * i;
+            sums[5] += j * i;
+        }
+    }
+    for (int k = 0; k < 6; ++k) {
+        partial[k][threadIdx.x] = sums[k];
+    }
+    __syncthreads();
+    for (int stride = blockDim.x / 2; stride > 0; stride >>= 1) {
+        if (threadIdx.x < stride) {
+            for (int k = 0; k < 6; ++k) {
+                partial[k][threadIdx.x] += partial[k][threadIdx.x + stride];
+            }
+        }
+        __syncthreads();
+    }
+    if (threadIdx.x == 0) {
+        for (int k = 0; k < 6; ++k) {
+            atomicAdd(&moments[k], partial[k][0]);
+        }
+    }
+}
+""",
+    "mask_moments",
+)
+
+
+class CupyRedColorThresholdStrategy(ThresholdStrategy):
+    """
+    Red color-based threshold strategy running on a CUDA device through CuPy.
+
+    This strategy applies the same red chromaticity limits as
+    RedColorThresholdStrategy, closing the mask and computing the moment sums
+    with a block reduction kernel on the GPU.
+    """
+
+    def __init__(self) -> None:
+        self._streams: Tuple[cp.cuda.Stream, cp.cuda.Stream] = (
+            cp.cuda.Stream(),
+            cp.cuda.Stream(),
+        )
+        self._shape: Optional[Tuple[int, ...]] = None
+
+    def _allocate(self, shape: Tuple[int, ...]) -> None:
+        """
+        Allocate the pinned host and device buffers used to upload frames.
+
+        Two buffers of each kind are kept, so one frame can be uploaded while
+        the kernel runs on the previous one.
+
+        Args:
+            shape (Tuple[int, ...]): The (rows, cols, 3) shape of the frames.
+        """
+        self._shape = shape
+        self._host = [cupyx.empty_pinned(shape, dtype=np.uint8) for _ in range(2)]
+        self._device = [cp.empty(shape, dtype=cp.uint8) for _ in range(2)]
+
+    def apply(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Convert the input frame to a binary image highlighting red regions.
+
+        Args:
+            frame (np.ndarray): The input color image frame.
+
+        Returns:
+            np.ndarray: The binary image after thresholding.
+        """
+        pixels = cp.asarray(frame)
+        binary = _RED_THRESHOLD(pixels[..., 0], pixels[..., 1], pixels[..., 2])
+        return cp.asnumpy(binary)
+
+    def apply_batch(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Convert a batch of frames to binary images highlighting red regions.
+
+        Args:
+            frames (np.ndarray): The input color frames as a (c, H, W, 3) array.
+
+        Returns:
+            np.ndarray: The binary images as a (c, H, W) array.
+        """
+        return self.apply(frames)
+
+    def moments(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Compute the raw spatial moments of the red regions of the frame.
+
+        Args:
+            frame (np.ndarray): The input color image frame.
+
+        Returns:
+            np.ndarray: The raw moments (m00, m10, m01, m20, m02, m11).
+        """
+        return self.moments_batch(frame[np.newaxis])[0]
+
+    def moments_batch(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Compute the raw spatial moments of the red regions of a batch of frames.
+
+        Each frame is thresholded, closed with a 3x3 morphological closing, and
+        reduced on the device. Frames alternate between two CUDA streams, so
+        the upload of each frame overlaps with the work on the previous one.
+
+        Args:
+            frames (np.ndarray): The input color frames as a (c, H, W, 3) array.
+
+        Returns:
+            np.ndarray: A (c, 6) array of raw moments (m00, m10, m01, m20, m02, m11).
+        """
+        if self._shape != frames.shape[1:]:
+            self._allocate(frames.shape[1:])
+        rows, cols = frames.shape[1], frames.shape[2]
+        blocks = min(-(-rows * cols // _BLOCK_SIZE), _MAX_BLOCKS)
+        moments = cp.zeros((len(frames), 6), dtype=cp.float64)
+        for k, frame in enumerate(frames):
+            slot = k % 2
+            stream = self._streams[slot]
+            stream.synchronize()
+            self._host[slot][...] = frame
+            self._device[slot].set(self._host[slot], stream=stream)
+            with stream:
+                pixels = self._device[slot]
+                binary = _RED_THRESHOLD(pixels[..., 0], pixels[..., 1], pixels[..., 2])
+                closed = ndimage.grey_closing(binary, size=(3, 3), mode="nearest")
+                _MASK_MOMENTS(
+                    (blocks,),
+                    (_BLOCK_SIZE,),
+                    (closed, np.int32(rows), np.int32(cols), moments[k]),
+                )
+        for stream in self._streams:
+            stream.synchronize()
+        return cp.asnumpy(moments)